@@ -5,16 +5,18 @@ Most runtime behavior is implemented in :class:`wss_py_wrapper.stimulation_contr
 """
 
 from .config import WssConfig
-from .log_sink import FileLogSink, LogSink
+from .log_sink import BinaryLogSink, FileLogSink, LogSink, read_binary_log
 from .logger import Logger
 from .stimulation_controller import StimulationController
 from .wss_loader import WssLoader
 
 __all__ = [
+    "BinaryLogSink",
     "FileLogSink",
     "LogSink",
     "Logger",
     "StimulationController",
     "WssConfig",
     "WssLoader",
+    "read_binary_log",
 ]
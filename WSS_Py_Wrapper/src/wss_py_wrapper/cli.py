@@ -9,6 +9,7 @@ import argparse
 import sys
 from pathlib import Path
 from dataclasses import replace
+from typing import Callable
 
 from .config import WssConfig
 from .stimulation_controller import StimulationController
@@ -51,11 +52,85 @@ def _print_command_help() -> None:
     print("  quit|exit           Terminate the program.")
 
 
-def _run_interactive_loop(controller: StimulationController) -> None:
-    running = True
+def _cmd_help(controller: StimulationController, parts: list[str]) -> None:
+    _print_command_help()
+
+
+def _cmd_start(controller: StimulationController, parts: list[str]) -> None:
+    controller.StartStimulation()
+    print("Stim start requested.")
+
+
+def _cmd_stop(controller: StimulationController, parts: list[str]) -> None:
+    controller.StopStimulation()
+    print("Stim stop requested.")
+
+
+def _cmd_status(controller: StimulationController, parts: list[str]) -> None:
+    print(
+        f"Ready={controller.Ready()}, Started={controller.Started()}, "
+        f"ModeValid={controller.isModeValid()}, BasicSupported={controller.BasicSupported}"
+    )
+
+
+def _cmd_reload_core(controller: StimulationController, parts: list[str]) -> None:
+    controller.LoadCoreConfigFile()
+    print("Core config reloaded.")
+
+
+def _cmd_reload_params(controller: StimulationController, parts: list[str]) -> None:
+    if len(parts) > 1:
+        controller.LoadParamsJson(parts[1])
+    else:
+        controller.LoadParamsJson()
+    print("Params reloaded.")
 
+
+def _cmd_save_params(controller: StimulationController, parts: list[str]) -> None:
+    controller.SaveParamsJson()
+    print("Params saved.")
+
+
+def _cmd_stim(controller: StimulationController, parts: list[str]) -> None:
+    if len(parts) < 3:
+        print("Usage: stim <finger|chX> <magnitude>")
+        return
+    magnitude = float(parts[2])
+    controller.StimWithMode(parts[1], magnitude)
+
+
+def _cmd_analog(controller: StimulationController, parts: list[str]) -> None:
+    if len(parts) < 3:
+        print("Usage: analog <finger|chX> <pw> [amp] [ipi]")
+        return
+    pw = int(parts[2])
+    amp = int(parts[3]) if len(parts) > 3 else 3
+    ipi = int(parts[4]) if len(parts) > 4 else 10
+    controller.StimulateAnalog(parts[1], pw, amp, ipi)
+
+
+def _cmd_unknown(controller: StimulationController, parts: list[str]) -> None:
+    print("Unknown command. Type 'help' to list options.")
+
+
+_QUIT_COMMANDS = frozenset(("quit", "exit"))
+
+_HANDLERS: dict[str, Callable[[StimulationController, list[str]], None]] = {
+    "help": _cmd_help,
+    "start": _cmd_start,
+    "stop": _cmd_stop,
+    "status": _cmd_status,
+    "reload-core": _cmd_reload_core,
+    "reload-params": _cmd_reload_params,
+    "save-params": _cmd_save_params,
+    "stim": _cmd_stim,
+    "analog": _cmd_analog,
+}
+
+
+def _run_interactive_loop(controller: StimulationController) -> None:
     try:
-        while running:
+        while True:
             try:
                 raw = input("> ").strip()
             except EOFError:
@@ -66,51 +141,11 @@ def _run_interactive_loop(controller: StimulationController) -> None:
 
             parts = raw.split()
             cmd = parts[0].lower()
+            if cmd in _QUIT_COMMANDS:
+                break
 
             try:
-                if cmd == "help":
-                    _print_command_help()
-                elif cmd in ("quit", "exit"):
-                    running = False
-                elif cmd == "start":
-                    controller.StartStimulation()
-                    print("Stim start requested.")
-                elif cmd == "stop":
-                    controller.StopStimulation()
-                    print("Stim stop requested.")
-                elif cmd == "status":
-                    print(
-                        f"Ready={controller.Ready()}, Started={controller.Started()}, "
-                        f"ModeValid={controller.isModeValid()}, BasicSupported={controller.BasicSupported}"
-                    )
-                elif cmd == "reload-core":
-                    controller.LoadCoreConfigFile()
-                    print("Core config reloaded.")
-                elif cmd == "reload-params":
-                    if len(parts) > 1:
-                        controller.LoadParamsJson(parts[1])
-                    else:
-                        controller.LoadParamsJson()
-                    print("Params reloaded.")
-                elif cmd == "save-params":
-                    controller.SaveParamsJson()
-                    print("Params saved.")
-                elif cmd == "stim":
-                    if len(parts) < 3:
-                        print("Usage: stim <finger|chX> <magnitude>")
-                        continue
-                    magnitude = float(parts[2])
-                    controller.StimWithMode(parts[1], magnitude)
-                elif cmd == "analog":
-                    if len(parts) < 3:
-                        print("Usage: analog <finger|chX> <pw> [amp] [ipi]")
-                        continue
-                    pw = int(parts[2])
-                    amp = int(parts[3]) if len(parts) > 3 else 3
-                    ipi = int(parts[4]) if len(parts) > 4 else 10
-                    controller.StimulateAnalog(parts[1], pw, amp, ipi)
-                else:
-                    print("Unknown command. Type 'help' to list options.")
+                _HANDLERS.get(cmd, _cmd_unknown)(controller, parts)
             except Exception as ex:
                 print(f"Command failed: {ex}")
     finally:
@@ -8,12 +8,34 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
+import os
 from pathlib import Path
 
+_CS_LIB_DIR_ENV = "WSS_CS_LIB_DIR"
+
 
 def _find_cs_libraries_dir(start: Path) -> Path:
+    """Locate the ``Cs_Libraries`` directory.
+
+    The ``WSS_CS_LIB_DIR`` environment variable takes precedence when set; otherwise
+    the parents of ``start`` are searched (see :func:`_search_cs_libraries_dir`).
+
+    :param start: Starting directory to probe.
+    :returns: The ``Cs_Libraries`` directory to use.
+    """
+    override = os.environ.get(_CS_LIB_DIR_ENV)
+    if override:
+        return Path(override)
+    return _search_cs_libraries_dir(start)
+
+
+@lru_cache(maxsize=32)
+def _search_cs_libraries_dir(start: Path) -> Path:
     """Search upward for a ``Cs_Libraries`` directory.
 
+    Results are cached per ``start`` since the layout does not change at runtime.
+
     :param start: Starting directory to probe.
     :returns: The first ``Cs_Libraries`` directory found when walking up parents.
     """
@@ -59,7 +81,8 @@ class WssConfig:
         """Create a default config using the current working directory.
 
         The returned config uses ``Path.cwd() / 'Config'`` for ``config_path`` and
-        discovers ``cs_lib_dir`` by searching upward for ``Cs_Libraries/``.
+        discovers ``cs_lib_dir`` by searching upward for ``Cs_Libraries/`` unless the
+        ``WSS_CS_LIB_DIR`` environment variable is set.
 
         :param main_file: File used to anchor log naming and initial DLL search.
         :returns: A default configuration instance.
@@ -1,50 +1,450 @@
 """Logging helpers.
 
-This module provides a minimal sink interface and a file sink. It also includes a
-bridge to bind a Python sink to the .NET ``Log.SetSink(...)`` API.
+This module provides a minimal sink interface, a text file sink and a compact binary
+sink. It also includes a bridge to bind a Python sink to the .NET ``Log.SetSink(...)``
+API.
 """
 
 from __future__ import annotations
 
-from datetime import datetime
+import os
 from pathlib import Path
+import queue
+import struct
+import sys
 import threading
-from typing import Callable
+import time
+from typing import Callable, Iterator
+import weakref
+
+_APPEND_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+
+# The fd is binary, so write the platform line ending that a text-mode file would
+# (CRLF on Windows).
+_LINE_END = os.linesep
+
+# Sentinel queued by FileLogSink.close() to stop the writer thread.
+_STOP = object()
+
+# Severity ordering for level names used by the wrapper and the C# ``LogLevel`` enum.
+_LEVELS = {
+    "TRACE": 5,
+    "DEBUG": 10,
+    "INFO": 20,
+    "WARN": 30,
+    "WARNING": 30,
+    "ERROR": 40,
+    "FATAL": 50,
+    "CRITICAL": 50,
+}
+
+# Canonical name per severity (first entry wins, e.g. WARN over WARNING).
+_LEVEL_NAMES = {value: name for name, value in reversed(_LEVELS.items())}
+
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# (epoch second, formatted text) of the most recent timestamp; log lines only carry
+# second resolution, so bursts within one second share a single strftime call.
+_timestamp_cache: tuple[int, str] = (-1, "")
+
+
+def _format_timestamp(ts: float) -> str:
+    """Format a ``time.time()`` value as local ``YYYY-MM-DD HH:MM:SS`` text.
+
+    :param ts: Seconds since the epoch.
+    :returns: Formatted timestamp.
+    """
+    global _timestamp_cache
+    second = int(ts)
+    cached = _timestamp_cache
+    if cached[0] != second:
+        cached = (second, time.strftime(_TIMESTAMP_FORMAT, time.localtime(second)))
+        _timestamp_cache = cached
+    return cached[1]
 
 
 class LogSink:
-    """Abstract sink used by :class:`~wss_py_wrapper.logger.Logger` and the C# bridge."""
+    """Abstract sink used by :class:`~wss_py_wrapper.logger.Logger` and the C# bridge.
 
-    def write(self, level: str, message: str) -> None:
+    Sinks accept every level by default; use :meth:`set_level` to drop records below
+    a minimum severity before they are formatted.
+    """
+
+    _min_level = 0
+
+    def set_level(self, level: str) -> None:
+        """Set the minimum level accepted by the sink.
+
+        :param level: Level name (e.g. ``"WARN"``).
+        :raises ValueError: If the level name is unknown.
+        """
+        try:
+            self._min_level = _LEVELS[level.upper()]
+        except KeyError:
+            raise ValueError(f"Unknown log level: {level}") from None
+
+    def is_enabled(self, level: str) -> bool:
+        """Return whether records at ``level`` would be written.
+
+        Unknown level names are always enabled.
+
+        :param level: Upper-case level text (e.g. ``INFO``).
+        """
+        return _LEVELS.get(level, self._min_level) >= self._min_level
+
+    def write(self, level: str, message: str, *args) -> None:
         """Write a log message.
 
+        Callers are expected to check :meth:`is_enabled` first; ``args`` are applied
+        to ``message`` with ``%`` only by the sink, so disabled records are never
+        formatted.
+
         :param level: Log level text (e.g. ``INFO``).
-        :param message: Log message.
+        :param message: Log message, or a ``%``-style format when ``args`` are given.
+        :param args: Optional format arguments.
         """
         raise NotImplementedError("Provide a sink implementation.")
 
+    def flush(self) -> None:
+        """Flush any buffered output. The default implementation does nothing."""
+
+    def close(self) -> None:
+        """Release resources held by the sink. The default implementation does nothing."""
+
 
 class FileLogSink(LogSink):
     """Thread-safe file sink.
 
+    :meth:`write` only enqueues the record. A background writer thread owns an
+    ``O_APPEND`` file descriptor, collects records for up to ``_BATCH_INTERVAL_S``
+    and appends each batch as one encoded buffer via ``os.write``. Call
+    :meth:`flush` to wait for queued records to reach the file and :meth:`close`
+    to stop the writer. The writer does not keep the sink alive: it is also
+    stopped when the sink is garbage-collected or the interpreter exits.
+
     :param path: File path to append logs to.
+    :param min_level: Optional minimum level name; see :meth:`LogSink.set_level`.
     """
 
-    def __init__(self, path: Path) -> None:
+    _BATCH_INTERVAL_S = 0.01
+    _MAX_BATCH = 1024
+
+    def __init__(self, path: Path, min_level: str | None = None) -> None:
         self._path = Path(path)
+        if min_level is not None:
+            self.set_level(min_level)
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
         self._lock = threading.Lock()
+        self._writer: threading.Thread | None = None
+        self._finalizer: weakref.finalize | None = None
 
     @property
     def path(self) -> Path:
         return self._path
 
-    def write(self, level: str, message: str) -> None:
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        line = f"[{timestamp}] {level}: {message}"
+    def write(self, level: str, message: str, *args) -> None:
+        if args:
+            message = message % args
+        record = (time.time(), level, message)
+        # Enqueue under the lock so a record can never land behind the stop
+        # sentinel of a concurrent close().
+        with self._lock:
+            self._queue.put(record)
+            writer = self._writer
+            if writer is None or not writer.is_alive():
+                self._start_writer()
+
+    def flush(self) -> None:
+        done = threading.Event()
+        with self._lock:
+            writer = self._writer
+            if writer is None or not writer.is_alive():
+                return
+            self._queue.put(done)
+        done.wait(timeout=2)
+
+    def close(self) -> None:
+        with self._lock:
+            finalizer = self._finalizer
+            if finalizer is not None:
+                finalizer()
+            self._finalizer = None
+            self._writer = None
+
+    def _start_writer(self) -> None:
+        """Open the log file and start the writer thread; called with ``_lock`` held.
+
+        The file is opened on the calling thread so an ``OSError`` reaches the
+        caller of :meth:`write`. A writer that died is replaced; records it left
+        in the queue are written by the new one.
+        """
+        if self._finalizer is not None:
+            self._finalizer.detach()
         self._path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self._path, _APPEND_FLAGS, 0o644)
+        writer = threading.Thread(
+            target=_run_file_writer,
+            args=(self._queue, fd, self._path, self._BATCH_INTERVAL_S, self._MAX_BATCH),
+            name="wss-log-writer",
+            daemon=True,
+        )
+        writer.start()
+        self._writer = writer
+        # Neither the thread nor the finalizer references the sink itself.
+        self._finalizer = weakref.finalize(self, _stop_file_writer, self._queue, writer)
+
+
+def _stop_file_writer(records: queue.SimpleQueue, writer: threading.Thread) -> None:
+    """Ask a :class:`FileLogSink` writer to finish and wait for it."""
+    if writer.is_alive():
+        records.put(_STOP)
+        writer.join(timeout=2)
+
+
+def _run_file_writer(records: queue.SimpleQueue, fd: int, path: Path, interval: float, max_batch: int) -> None:
+    try:
+        pending: list[tuple[float, str, str]] = []
+        while True:
+            item = records.get()
+            deadline = time.monotonic() + interval
+            while True:
+                if item is _STOP:
+                    # Anything queued behind the sentinel is written, not lost.
+                    while True:
+                        try:
+                            item = records.get_nowait()
+                        except queue.Empty:
+                            break
+                        if isinstance(item, threading.Event):
+                            item.set()
+                        elif item is not _STOP:
+                            pending.append(item)
+                    _write_file_batch(fd, path, pending)
+                    return
+                if isinstance(item, threading.Event):
+                    _write_file_batch(fd, path, pending)
+                    item.set()
+                else:
+                    pending.append(item)
+                    if len(pending) >= max_batch:
+                        break
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    item = records.get(timeout=timeout)
+                except queue.Empty:
+                    break
+            _write_file_batch(fd, path, pending)
+    finally:
+        os.close(fd)
+
+
+def _write_file_batch(fd: int, path: Path, pending: list[tuple[float, str, str]]) -> None:
+    if not pending:
+        return
+    try:
+        # One f-string per line and a single encode per batch; joining a list is
+        # cheaper than a generator, and per-line bytes pieces measured slower.
+        text = "".join([f"[{_format_timestamp(ts)}] {level}: {message}{_LINE_END}" for ts, level, message in pending])
+        data = memoryview(text.encode("utf-8", "replace"))
+        while data:
+            written = os.write(fd, data)
+            data = data[written:]
+    except Exception as ex:
+        # The writer thread has no caller to raise to; report and drop the batch.
+        print(f"FileLogSink: dropped {len(pending)} record(s) for {path}: {ex}", file=sys.stderr)
+    pending.clear()
+
+
+_BINARY_MAGIC = b"WSSBLOG1"
+_BINARY_COUNT = struct.Struct("<I")
+_BINARY_RECORD = struct.Struct("<QBxxxQI")
+_BINARY_ARG_MAX = 0xFFFFFFFF
+
+
+class BinaryLogSink(LogSink):
+    """Binary sink writing fixed-size records for high-rate logging.
+
+    Each record is 24 bytes: ``<uint64 ts_ns><uint8 level><3 pad><uint64 msg_id><uint32 arg>``.
+    Message format strings are registered up front with :meth:`register_message` and
+    written once as a header when the first record is stored. Use
+    :func:`read_binary_log` to turn a file back into text.
+
+    :meth:`write` (the generic :class:`LogSink` entry point) never raises: messages
+    that were not registered, or whose argument is not an unsigned 32-bit integer,
+    are counted in :attr:`dropped` instead.
+
+    :param path: File path to write. An existing file is replaced by the first
+        record; records after :meth:`close` are appended to it.
+    :param min_level: Optional minimum level name; see :meth:`LogSink.set_level`.
+    """
+
+    def __init__(self, path: Path, min_level: str | None = None) -> None:
+        self._path = Path(path)
+        if min_level is not None:
+            self.set_level(min_level)
+        self._lock = threading.Lock()
+        self._handle = None
+        self._header_written = False
+        self._dropped = 0
+        self._messages: list[str] = []
+        self._message_ids: dict[str, int] = {}
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def dropped(self) -> int:
+        """Number of :meth:`write` calls discarded because they could not be encoded."""
+        return self._dropped
+
+    def register_message(self, fmt: str) -> int:
+        """Register a message format and return its id.
+
+        ``fmt`` may contain a single ``%``-style placeholder for the record argument.
+
+        :param fmt: Message format string.
+        :returns: Id to pass to :meth:`record`.
+        :raises RuntimeError: If records have already been written.
+        """
+        with self._lock:
+            msg_id = self._message_ids.get(fmt)
+            if msg_id is not None:
+                return msg_id
+            if self._header_written:
+                raise RuntimeError("Register messages before the first record is written.")
+            msg_id = len(self._messages)
+            self._messages.append(fmt)
+            self._message_ids[fmt] = msg_id
+            return msg_id
+
+    def record(self, level: str, msg_id: int, arg: int = 0) -> None:
+        """Append a record for a registered message.
+
+        :param level: Upper-case level text (e.g. ``INFO``).
+        :param msg_id: Id returned by :meth:`register_message`.
+        :param arg: Unsigned 32-bit argument stored with the record.
+        :raises ValueError: If ``msg_id`` is not registered or ``arg`` is not an
+            unsigned 32-bit integer.
+        """
+        if not self.is_enabled(level):
+            return
+        if not isinstance(msg_id, int) or not 0 <= msg_id < len(self._messages):
+            raise ValueError(f"Message id is not registered: {msg_id!r}")
+        if not isinstance(arg, int) or not 0 <= arg <= _BINARY_ARG_MAX:
+            raise ValueError(f"Record argument must be an unsigned 32-bit integer: {arg!r}")
+        data = _BINARY_RECORD.pack(time.time_ns(), _LEVELS.get(level, 0), msg_id, arg)
+        with self._lock:
+            handle = self._handle
+            if handle is None:
+                handle = self._open()
+            handle.write(data)
+
+    def write(self, level: str, message: str, *args) -> None:
+        """Append a record for a registered message format.
+
+        The first of ``args`` (if any) is stored as the record argument. Records
+        that cannot be encoded are counted in :attr:`dropped`.
+        """
+        if not self.is_enabled(level):
+            return
+        msg_id = self._message_ids.get(message)
+        arg = args[0] if args else 0
+        if msg_id is None or not isinstance(arg, int) or not 0 <= arg <= _BINARY_ARG_MAX:
+            with self._lock:
+                self._dropped += 1
+            return
+        self.record(level, msg_id, arg)
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._handle is not None:
+                self._handle.flush()
+
+    def close(self) -> None:
         with self._lock:
-            with self._path.open("a", encoding="utf-8") as handle:
-                handle.write(line + "\n")
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+
+    def _open(self):
+        if self._header_written:
+            # Reopened after close(): keep the header and records already on disk.
+            handle = self._path.open("ab")
+            self._handle = handle
+            return handle
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        handle = self._path.open("wb")
+        self._header_written = True
+        handle.write(_BINARY_MAGIC)
+        handle.write(_BINARY_COUNT.pack(len(self._messages)))
+        for fmt in self._messages:
+            encoded = fmt.encode("utf-8")
+            handle.write(_BINARY_COUNT.pack(len(encoded)))
+            handle.write(encoded)
+        self._handle = handle
+        return handle
+
+
+def read_binary_log(path: Path) -> Iterator[tuple[int, str, str]]:
+    """Decode a file written by :class:`BinaryLogSink`.
+
+    A truncated trailing record is ignored.
+
+    :param path: Binary log file.
+    :returns: Iterator of ``(ts_ns, level, message)`` tuples.
+    :raises ValueError: If the file does not start with a binary log header.
+    """
+    with Path(path).open("rb") as handle:
+        if handle.read(len(_BINARY_MAGIC)) != _BINARY_MAGIC:
+            raise ValueError(f"{path} is not a WSS binary log.")
+        (count,) = _BINARY_COUNT.unpack(handle.read(_BINARY_COUNT.size))
+        messages = []
+        for _ in range(count):
+            (length,) = _BINARY_COUNT.unpack(handle.read(_BINARY_COUNT.size))
+            messages.append(handle.read(length).decode("utf-8"))
+
+        while True:
+            data = handle.read(_BINARY_RECORD.size)
+            if len(data) < _BINARY_RECORD.size:
+                return
+            ts_ns, level, msg_id, arg = _BINARY_RECORD.unpack(data)
+            fmt = messages[msg_id] if msg_id < len(messages) else f"<unknown message {msg_id}>"
+            try:
+                text = fmt % arg
+            except (TypeError, ValueError):
+                text = fmt
+            yield ts_ns, _LEVEL_NAMES.get(level, str(level)), text
+
+
+# Closed ``Action<LogLevel,string>`` delegate types keyed by the resolved .NET Log type.
+_sink_delegate_types: dict = {}
+
+
+def _sink_delegate_type(log_type):
+    """Return the ``Action<LogLevel,string>`` type for ``log_type``, building it once.
+
+    :param log_type: Resolved .NET ``Log`` type exposing a nested ``LogLevel`` enum.
+    """
+    delegate_type = _sink_delegate_types.get(log_type)
+    if delegate_type is None:
+        from System import Action  # type: ignore
+
+        delegate_type = _sink_delegate_types[log_type] = Action[log_type.LogLevel, str]
+    return delegate_type
+
+
+def _level_name(level) -> str:
+    """Return upper-case level text for a C# ``LogLevel`` value.
+
+    :param level: .NET enum value (or any object with a sensible ``str``).
+    """
+    try:
+        return level.ToString().upper()
+    except Exception:
+        return str(level).upper()
 
 
 def install_csharp_log_sink(log_type, sink: LogSink) -> Callable[[], None]:
@@ -54,16 +454,21 @@ def install_csharp_log_sink(log_type, sink: LogSink) -> Callable[[], None]:
     :param sink: Python sink implementation.
     :returns: A callback that resets the sink back to the default C# sink.
     """
-    from System import Action  # type: ignore
+    # The LogLevel enum has a handful of members; convert each one to text once.
+    level_names: dict = {}
 
     def handler(level, message) -> None:
         try:
-            level_text = level.ToString()
-        except Exception:
-            level_text = str(level)
-        sink.write(level_text.upper(), str(message))
+            level_text = level_names[level]
+        except KeyError:
+            level_text = level_names[level] = _level_name(level)
+        except TypeError:
+            level_text = _level_name(level)
+        if not sink.is_enabled(level_text):
+            return
+        sink.write(level_text, str(message))
 
-    delegate = Action[log_type.LogLevel, str](handler)
+    delegate = _sink_delegate_type(log_type)(handler)
     log_type.SetSink(delegate)
 
     def reset() -> None:
@@ -16,23 +16,47 @@ class Logger:
     def __init__(self, sink: LogSink) -> None:
         self._sink = sink
 
-    def info(self, message: str) -> None:
+    def is_enabled_for(self, level: str) -> bool:
+        """Return whether the sink accepts ``level``.
+
+        Use this to skip building expensive messages that would be discarded.
+
+        :param level: Level name (e.g. ``"DEBUG"``).
+        """
+        return self._sink.is_enabled(level.upper())
+
+    def debug(self, message: str, *args) -> None:
+        """Write a DEBUG message.
+
+        :param message: Message text, or a ``%``-style format when ``args`` are given.
+        :param args: Format arguments, applied only if the level is enabled.
+        """
+        if self._sink.is_enabled("DEBUG"):
+            self._sink.write("DEBUG", message, *args)
+
+    def info(self, message: str, *args) -> None:
         """Write an INFO message.
 
-        :param message: Message text.
+        :param message: Message text, or a ``%``-style format when ``args`` are given.
+        :param args: Format arguments, applied only if the level is enabled.
         """
-        self._sink.write("INFO", message)
+        if self._sink.is_enabled("INFO"):
+            self._sink.write("INFO", message, *args)
 
-    def warning(self, message: str) -> None:
+    def warning(self, message: str, *args) -> None:
         """Write a WARN message.
 
-        :param message: Message text.
+        :param message: Message text, or a ``%``-style format when ``args`` are given.
+        :param args: Format arguments, applied only if the level is enabled.
         """
-        self._sink.write("WARN", message)
+        if self._sink.is_enabled("WARN"):
+            self._sink.write("WARN", message, *args)
 
-    def error(self, message: str) -> None:
+    def error(self, message: str, *args) -> None:
         """Write an ERROR message.
 
-        :param message: Message text.
+        :param message: Message text, or a ``%``-style format when ``args`` are given.
+        :param args: Format arguments, applied only if the level is enabled.
         """
-        self._sink.write("ERROR", message)
+        if self._sink.is_enabled("ERROR"):
+            self._sink.write("ERROR", message, *args)
@@ -6,19 +6,23 @@ This module contains the interop-heavy runtime core. The main entry point is
 
 from __future__ import annotations
 
+from array import array
+from functools import lru_cache
 from pathlib import Path
 import threading
 import time
 
 from .config import WssConfig
 from .log_sink import FileLogSink, install_csharp_log_sink
-from .wss_loader import WssLoader, collect_dlls
+from .wss_loader import WssLoader, collect_dlls, resolve_net_types
 
 
+@lru_cache(maxsize=None)
 def _resolve_log_type():
     """Resolve the .NET ``Log`` type from supported namespaces.
 
-    The wrapper supports multiple namespace layouts depending on the DLL set.
+    The wrapper supports multiple namespace layouts depending on the DLL set. The
+    result is cached for the process; a failed lookup is not cached.
 
     :returns: A .NET type exposing ``SetSink``/``ResetSink`` and level methods.
     :raises RuntimeError: If no compatible Log type can be located.
@@ -49,6 +53,128 @@ def _resolve_log_type():
     raise RuntimeError("Unable to locate C# Log type in WSS_Core_Interface.dll.")
 
 
+def _bind_log_method(log_type, name: str):
+    """Bind a static ``Log.<name>(string)`` method for repeated calls.
+
+    A typed ``Action<string>`` delegate is preferred so each call skips pythonnet's
+    overload resolution. The plain member binding is used when the delegate cannot
+    be created (e.g. the Log type is exposed as a namespace module).
+
+    :param log_type: Resolved .NET ``Log`` type.
+    :param name: Static method name (e.g. ``"Error"``).
+    :returns: A callable taking the message text, or ``None`` if unavailable.
+    """
+    try:
+        import clr  # type: ignore
+        from System import Action, Array, Delegate, String, Type  # type: ignore
+
+        string_type = clr.GetClrType(String)
+        method = clr.GetClrType(log_type).GetMethod(name, Array[Type]([string_type]))
+        if method is not None:
+            delegate_type = clr.GetClrType(Action[String])
+            return Delegate.CreateDelegate(delegate_type, method).Invoke
+    except Exception:
+        pass
+
+    return getattr(log_type, name, None)
+
+
+_NOT_INITIALIZED = "Call Initialize() before using the stimulation controller."
+_INIT_IN_PROGRESS = "Initialize() is already in progress."
+
+# Finger names accepted wherever a channel alias is expected.
+_FINGER_CHANNELS = {
+    "thumb": 1,
+    "index": 2,
+    "middle": 3,
+    "ring": 4,
+    "pinky": 5,
+    "little": 5,
+}
+
+# .NET methods called from the tick loop and per-stimulation paths.
+_HOT_METHODS = frozenset(("Tick", "StimulateAnalog", "StimulateNormalized", "StimWithMode"))
+
+
+def _prepare_methods(net_object, names: frozenset[str]) -> None:
+    """JIT-compile selected methods of a .NET object ahead of their first call.
+
+    This moves the first-call JIT cost out of the tick loop and the first stimulation
+    command. Methods that cannot be prepared are skipped.
+
+    :param net_object: .NET instance whose runtime type is inspected.
+    :param names: Method names to prepare (all overloads).
+    """
+    try:
+        from System.Runtime.CompilerServices import RuntimeHelpers  # type: ignore
+
+        methods = net_object.GetType().GetMethods()
+    except Exception:
+        return
+
+    for method in methods:
+        if method.Name not in names or method.IsAbstract or method.ContainsGenericParameters:
+            continue
+        try:
+            RuntimeHelpers.PrepareMethod(method.MethodHandle)
+        except Exception:
+            pass
+
+
+def _is_waveform_sequence(value) -> bool:
+    """Return whether ``value`` holds raw waveform samples (list, tuple or 1-D array)."""
+    return isinstance(value, (list, tuple)) or getattr(value, "ndim", None) == 1
+
+
+@lru_cache(maxsize=None)
+def _int32_array_interop():
+    """Resolve ``Int32[]`` and the ``Marshal.Copy`` overload used by :func:`_to_int32_array`.
+
+    Binding ``Marshal.Copy(IntPtr, Int32[], Int32, Int32)`` once avoids pythonnet's
+    overload resolution across the ~16 ``Copy`` overloads on every call, which costs
+    far more than the copy itself.
+
+    :returns: ``(Int32[] type, IntPtr type, bound Marshal.Copy)``.
+    """
+    from System import Array, Int32, IntPtr  # type: ignore
+    from System.Runtime.InteropServices import Marshal  # type: ignore
+
+    int32_array = Array[Int32]
+    return int32_array, IntPtr, Marshal.Copy.__overloads__[IntPtr, int32_array, Int32, Int32]
+
+
+def _to_int32_array(samples):
+    """Convert waveform samples to a .NET ``Int32[]`` with a single bulk copy.
+
+    Contiguous ``numpy`` int32 arrays are copied directly. Other sequences are first
+    packed into a C ``int`` buffer by :mod:`array` (a C-level loop instead of
+    pythonnet's per-element conversion) and then copied with ``Marshal.Copy``.
+
+    :param samples: List, tuple or 1-D array of integer samples.
+    :returns: A ``System.Int32[]`` instance.
+    :raises OverflowError: If a sample does not fit in 32 bits.
+    """
+    int32_array, intptr, copy = _int32_array_interop()
+
+    dtype = getattr(samples, "dtype", None)
+    if dtype is not None and str(dtype) == "int32" and samples.flags["C_CONTIGUOUS"]:
+        buffer = samples
+        address, count = samples.ctypes.data, len(samples)
+    else:
+        if hasattr(samples, "tolist"):
+            samples = samples.tolist()
+        buffer = array("i", samples)
+        if buffer.itemsize != 4:
+            return int32_array(list(samples))
+        address, count = buffer.buffer_info()
+
+    result = int32_array(count)
+    if count:
+        # ``buffer`` keeps the source memory alive until the copy completes.
+        copy(intptr(address), result, 0, count)
+    return result
+
+
 class StimulationController:
     """Python wrapper around the WSS .NET stimulation controller layers.
 
@@ -58,22 +184,32 @@ class StimulationController:
 
     Threading:
     - A background tick loop calls ``Tick()`` at ``config.tick_interval_ms``.
-    - Methods are guarded by an internal lock at key lifecycle transitions.
+    - Methods are guarded by an internal lock at key lifecycle transitions. The
+      lock is not held during the .NET ``Initialize()`` call of :meth:`Initialize`
+      or :meth:`resetRadio`; a concurrent :meth:`Shutdown`, :meth:`resetRadio` or
+      first :meth:`Initialize` raises ``RuntimeError`` instead of waiting for it.
 
     :param config: Wrapper configuration.
     """
 
     def __init__(self, config: WssConfig) -> None:
         self._config = config
+        self._config_path_str = str(config.config_path)
         self._gate = threading.Lock()
+        self._initializing = False
         self._wss = None
         self._basic_wss = None
         self._basic_supported = False
         self._tick_thread: threading.Thread | None = None
         self._tick_stop = threading.Event()
         self._log_reset = None
+        self._log_sink = None
         self._log_type = None
+        self._log_error_method = None
         self._net_types = None
+        self._t_broadcast = None
+        self._target_tuple = None
+        self._t_waveform_builder = None
         self.started = False
 
     @property
@@ -88,23 +224,44 @@ class StimulationController:
         once initialized.
 
         :raises FileNotFoundError: If required DLLs cannot be found.
-        :raises RuntimeError: If required .NET types cannot be imported.
+        :raises RuntimeError: If required .NET types cannot be imported, or if
+            another thread is already initializing.
         """
         with self._gate:
             if self._wss is not None:
                 return
+            if self._initializing:
+                raise RuntimeError(_INIT_IN_PROGRESS)
+            self._initializing = True
 
+        # Only one thread gets past the flag above, so the slow interop setup runs
+        # without holding the lock.
+        core = params_layer = model_layer = None
+        try:
             self._load_dotnet()
             self._install_log_sink()
 
             core = self._create_core()
-            params_layer = self._net_types["StimParamsLayer"](core, str(self._config.config_path))
-            model_layer = self._net_types["ModelParamsLayer"](params_layer, str(self._config.config_path))
+            params_layer = self._net_types["StimParamsLayer"](core, self._config_path_str)
+            model_layer = self._net_types["ModelParamsLayer"](params_layer, self._config_path_str)
+            basic_supported, basic_wss = self._try_get_basic(model_layer)
+
+            model_layer.Initialize()
+            _prepare_methods(model_layer, _HOT_METHODS)
+        except BaseException:
+            # Release whatever was built, outermost first; a layer may already have
+            # released the ones below it, and _discard_layer() tolerates that.
+            for layer in (model_layer, params_layer, core):
+                if layer is not None:
+                    self._discard_layer(layer)
+            with self._gate:
+                self._initializing = False
+            raise
 
+        with self._gate:
             self._wss = model_layer
-            self._basic_supported, self._basic_wss = self._try_get_basic(self._wss)
-
-            self._wss.Initialize()
+            self._basic_supported, self._basic_wss = basic_supported, basic_wss
+            self._initializing = False
             self._ensure_tick_loop()
 
     def Shutdown(self) -> None:
@@ -112,24 +269,36 @@ class StimulationController:
 
         Exceptions during shutdown are logged (when possible) but do not prevent
         the remainder of cleanup.
+
+        :raises RuntimeError: If :meth:`Initialize` is in progress on another thread.
         """
         with self._gate:
+            if self._initializing:
+                raise RuntimeError(_INIT_IN_PROGRESS)
             self._stop_tick_loop()
             if self._wss is not None:
                 try:
                     self._wss.Shutdown()
                 except Exception as ex:
-                    self._log_error(f"Error during Shutdown: {ex}")
+                    self._log_error("Error during Shutdown: %s", ex)
                 try:
                     self._wss.Dispose()
                 except Exception as ex:
-                    self._log_error(f"Error disposing stimulation core: {ex}")
+                    self._log_error("Error disposing stimulation core: %s", ex)
 
             if self._log_reset is not None:
                 try:
                     self._log_reset()
                 except Exception:
                     pass
+                self._log_reset = None
+
+            if self._log_sink is not None:
+                try:
+                    self._log_sink.close()
+                except Exception:
+                    pass
+                self._log_sink = None
 
             self._wss = None
             self._basic_wss = None
@@ -145,13 +314,30 @@ class StimulationController:
 
         This shuts down and re-initializes the underlying .NET object and
         restarts the tick loop.
+
+        :raises RuntimeError: If :meth:`Initialize` or another reset is in progress.
         """
         with self._gate:
             if self._wss is None:
                 return
+            if self._initializing:
+                raise RuntimeError(_INIT_IN_PROGRESS)
+            self._initializing = True
             self._stop_tick_loop()
-            self._wss.Shutdown()
-            self._wss.Initialize()
+            wss = self._wss
+
+        # As in Initialize(), the flag keeps Initialize()/Shutdown() out while the
+        # slow .NET restart runs without holding the lock.
+        try:
+            wss.Shutdown()
+            wss.Initialize()
+        except BaseException:
+            with self._gate:
+                self._initializing = False
+            raise
+
+        with self._gate:
+            self._initializing = False
             self._ensure_tick_loop()
 
     def _ensure_tick_loop(self) -> None:
@@ -160,19 +346,35 @@ class StimulationController:
         if self._tick_thread is not None and self._tick_thread.is_alive():
             return
 
-        self._stop_tick_loop()
-        self._tick_stop.clear()
+        # Shutdown()/resetRadio() do the blocking stop, so only drop the stale
+        # reference here. Each thread gets its own stop event: a thread whose join
+        # timed out keeps its set event and exits instead of resuming.
+        self._tick_thread = None
+        stop = threading.Event()
+        self._tick_stop = stop
 
-        interval = max(1, int(self._config.tick_interval_ms))
+        interval = max(1, int(self._config.tick_interval_ms)) / 1000.0
+        # Bind the .NET method once; the loop is stopped before _wss is replaced.
+        tick = self._wss.Tick
 
         def loop() -> None:
-            while not self._tick_stop.is_set():
+            # Ticks are scheduled against monotonic deadlines so Tick() duration does
+            # not stretch the period; if a tick overruns, the schedule restarts from
+            # now rather than bursting to catch up. Waiting on the stop event rather
+            # than sleeping lets _stop_tick_loop() wake the thread immediately.
+            next_deadline = time.monotonic() + interval
+            while not stop.is_set():
                 try:
-                    if self._wss is not None:
-                        self._wss.Tick()
+                    tick()
                 except Exception as ex:
-                    self._log_error(f"Tick loop failure: {ex}")
-                time.sleep(interval / 1000.0)
+                    self._log_error("Tick loop failure: %s", ex)
+                now = time.monotonic()
+                delay = next_deadline - now
+                if delay > 0:
+                    next_deadline += interval
+                    stop.wait(delay)
+                else:
+                    next_deadline = now + interval
 
         self._tick_thread = threading.Thread(target=loop, name="wss-tick", daemon=True)
         self._tick_thread.start()
@@ -203,7 +405,7 @@ class StimulationController:
         :raises RuntimeError: If called before :meth:`Initialize`.
         """
         wss = self._ensure_wss()
-        wss.StartStim(self._net_types["WssTarget"].Broadcast)
+        wss.StartStim(self._t_broadcast)
         self.started = True
 
     def StopStimulation(self) -> None:
@@ -212,21 +414,21 @@ class StimulationController:
         :raises RuntimeError: If called before :meth:`Initialize`.
         """
         wss = self._ensure_wss()
-        wss.StopStim(self._net_types["WssTarget"].Broadcast)
+        wss.StopStim(self._t_broadcast)
         self.started = False
 
     def Save(self, targetWSS: int | None = None) -> None:
         basic = self._require_basic()
         if basic is None:
             return
-        target = self._int_to_wss_target(targetWSS)
+        target = self._t_broadcast if targetWSS is None else self._int_to_wss_target(targetWSS)
         basic.Save(target)
 
     def load(self, targetWSS: int | None = None) -> None:
         basic = self._require_basic()
         if basic is None:
             return
-        target = self._int_to_wss_target(targetWSS)
+        target = self._t_broadcast if targetWSS is None else self._int_to_wss_target(targetWSS)
         basic.Load(target)
 
     def request_Configs(self, targetWSS: int, command: int, id: int) -> None:
@@ -240,29 +442,29 @@ class StimulationController:
         if basic is None:
             return
 
-        if len(args) == 2 and isinstance(args[0], self._net_types["WaveformBuilder"]):
+        if len(args) == 2 and isinstance(args[0], self._t_waveform_builder):
             waveform, event_id = args
-            basic.UpdateWaveform(waveform, event_id, self._net_types["WssTarget"].Broadcast)
+            basic.UpdateWaveform(waveform, event_id, self._t_broadcast)
             return
 
-        if len(args) == 3 and isinstance(args[0], int) and isinstance(args[1], self._net_types["WaveformBuilder"]):
+        if len(args) == 3 and isinstance(args[0], int) and isinstance(args[1], self._t_waveform_builder):
             target, waveform, event_id = args
             basic.UpdateWaveform(waveform, event_id, self._int_to_wss_target(target))
             return
 
-        if len(args) == 2 and isinstance(args[0], (list, tuple)):
+        if len(args) == 2 and _is_waveform_sequence(args[0]):
             waveform, event_id = args
-            basic.UpdateWaveform(waveform, event_id, self._net_types["WssTarget"].Broadcast)
+            basic.UpdateWaveform(_to_int32_array(waveform), event_id, self._t_broadcast)
             return
 
-        if len(args) == 3 and isinstance(args[0], int) and isinstance(args[1], (list, tuple)):
+        if len(args) == 3 and isinstance(args[0], int) and _is_waveform_sequence(args[1]):
             target, waveform, event_id = args
-            basic.UpdateWaveform(waveform, event_id, self._int_to_wss_target(target))
+            basic.UpdateWaveform(_to_int32_array(waveform), event_id, self._int_to_wss_target(target))
             return
 
         if len(args) == 3 and all(isinstance(a, int) for a in args):
             cathodic, anodic, event_id = args
-            basic.UpdateEventShape(cathodic, anodic, event_id, self._net_types["WssTarget"].Broadcast)
+            basic.UpdateEventShape(cathodic, anodic, event_id, self._t_broadcast)
             return
 
         if len(args) == 4 and all(isinstance(a, int) for a in args):
@@ -282,14 +484,14 @@ class StimulationController:
         basic = self._require_basic()
         if basic is None:
             return
-        target = self._int_to_wss_target(targetWSS)
+        target = self._t_broadcast if targetWSS is None else self._int_to_wss_target(targetWSS)
         basic.WaveformSetup(wave, eventID, target)
 
     def UpdateIPD(self, ipd: int, eventID: int, targetWSS: int | None = None) -> None:
         basic = self._require_basic()
         if basic is None:
             return
-        target = self._int_to_wss_target(targetWSS)
+        target = self._t_broadcast if targetWSS is None else self._int_to_wss_target(targetWSS)
         basic.UpdateIPD(ipd, eventID, target)
 
     def StimulateNormalized(self, finger: str, magnitude: float) -> None:
@@ -304,7 +506,9 @@ class StimulationController:
         wss.StimulateNormalized(ch, magnitude)
 
     def GetStimIntensity(self, finger: str) -> int:
-        wss = self._ensure_wss()
+        wss = self._wss
+        if wss is None:
+            raise RuntimeError(_NOT_INITIALIZED)
         ch = self._finger_to_channel(finger)
         return int(wss.GetStimIntensity(ch))
 
@@ -327,13 +531,22 @@ class StimulationController:
         self._ensure_wss().AddOrUpdateStimParam(key, value)
 
     def GetStimParam(self, key: str) -> float:
-        return self._ensure_wss().GetStimParam(key)
+        wss = self._wss
+        if wss is None:
+            raise RuntimeError(_NOT_INITIALIZED)
+        return wss.GetStimParam(key)
 
     def TryGetStimParam(self, key: str):
-        return self._ensure_wss().TryGetStimParam(key)
+        wss = self._wss
+        if wss is None:
+            raise RuntimeError(_NOT_INITIALIZED)
+        return wss.TryGetStimParam(key)
 
     def GetAllStimParams(self):
-        return self._ensure_wss().GetAllStimParams()
+        wss = self._wss
+        if wss is None:
+            raise RuntimeError(_NOT_INITIALIZED)
+        return wss.GetAllStimParams()
 
     def SetChannelAmp(self, finger: str, mA: float) -> None:
         wss = self._ensure_wss()
@@ -356,22 +569,30 @@ class StimulationController:
         wss.SetChannelIPI(ch, ms)
 
     def GetChannelAmp(self, finger: str) -> float:
-        wss = self._ensure_wss()
+        wss = self._wss
+        if wss is None:
+            raise RuntimeError(_NOT_INITIALIZED)
         ch = self._finger_to_channel(finger)
         return wss.GetChannelAmp(ch)
 
     def GetChannelPWMin(self, finger: str) -> int:
-        wss = self._ensure_wss()
+        wss = self._wss
+        if wss is None:
+            raise RuntimeError(_NOT_INITIALIZED)
         ch = self._finger_to_channel(finger)
         return wss.GetChannelPWMin(ch)
 
     def GetChannelPWMax(self, finger: str) -> int:
-        wss = self._ensure_wss()
+        wss = self._wss
+        if wss is None:
+            raise RuntimeError(_NOT_INITIALIZED)
         ch = self._finger_to_channel(finger)
         return wss.GetChannelPWMax(ch)
 
     def GetChannelIPI(self, finger: str) -> int:
-        wss = self._ensure_wss()
+        wss = self._wss
+        if wss is None:
+            raise RuntimeError(_NOT_INITIALIZED)
         ch = self._finger_to_channel(finger)
         return wss.GetChannelIPI(ch)
 
@@ -438,39 +659,18 @@ class StimulationController:
         loader = WssLoader(dlls)
         loader.load()
 
-        try:
-            from WSS_Core_Interface import (  # type: ignore
-                CoreConfigController,
-                ModelConfigController,
-                ModelParamsLayer,
-                StimParamsLayer,
-                WaveformBuilder,
-                WssStimulationCore,
-                WssTarget,
-            )
-        except Exception:
-            from Wss.CoreModule import (  # type: ignore
-                CoreConfigController,
-                WaveformBuilder,
-                WssStimulationCore,
-                WssTarget,
-            )
-            from Wss.ModelModule import ModelConfigController, ModelParamsLayer  # type: ignore
-            from Wss.CalibrationModule import StimParamsLayer  # type: ignore
-
-        self._net_types = {
-            "CoreConfigController": CoreConfigController,
-            "ModelConfigController": ModelConfigController,
-            "ModelParamsLayer": ModelParamsLayer,
-            "StimParamsLayer": StimParamsLayer,
-            "WaveformBuilder": WaveformBuilder,
-            "WssStimulationCore": WssStimulationCore,
-            "WssTarget": WssTarget,
-        }
+        self._net_types = resolve_net_types()
+
+        # Cache enum members and types used on every stimulation call.
+        wss_target = self._net_types["WssTarget"]
+        self._t_broadcast = wss_target.Broadcast
+        # Indexed by the integer target value; 0 is the broadcast target.
+        self._target_tuple = (self._t_broadcast, wss_target.Wss1, wss_target.Wss2, wss_target.Wss3)
+        self._t_waveform_builder = self._net_types["WaveformBuilder"]
 
     def _create_core(self):
         core_class = self._net_types["WssStimulationCore"]
-        config_path = str(self._config.config_path)
+        config_path = self._config_path_str
         if self._config.serial_port:
             return core_class(self._config.serial_port, config_path, self._config.test_mode, self._config.max_setup_tries)
         return core_class(config_path, self._config.test_mode, self._config.max_setup_tries)
@@ -479,20 +679,35 @@ class StimulationController:
         if self._log_reset is not None:
             return
         self._log_type = _resolve_log_type()
-        sink = FileLogSink(self._config.log_path)
-        self._log_reset = install_csharp_log_sink(self._log_type, sink)
-
-    def _log_error(self, message: str) -> None:
-        if self._log_type is None:
+        # Resolve the .NET method once; attribute access on the type proxy goes
+        # through pythonnet's member lookup on every call otherwise.
+        self._log_error_method = _bind_log_method(self._log_type, "Error")
+        self._log_sink = FileLogSink(self._config.log_path)
+        self._log_reset = install_csharp_log_sink(self._log_type, self._log_sink)
+
+    def _log_error(self, message: str, *args) -> None:
+        log_error = self._log_error_method
+        if log_error is None:
             return
         try:
-            self._log_type.Error(message)
+            log_error(message % args if args else message)
         except Exception:
             pass
 
+    def _discard_layer(self, layer) -> None:
+        """Best-effort ``Shutdown()``/``Dispose()`` of a layer left by a failed :meth:`Initialize`."""
+        for name in ("Shutdown", "Dispose"):
+            method = getattr(layer, name, None)
+            if method is None:
+                continue
+            try:
+                method()
+            except Exception as ex:
+                self._log_error("Error during %s after failed Initialize: %s", name, ex)
+
     def _ensure_wss(self):
         if self._wss is None:
-            raise RuntimeError("Call Initialize() before using the stimulation controller.")
+            raise RuntimeError(_NOT_INITIALIZED)
         return self._wss
 
     def _try_get_basic(self, wss):
@@ -514,37 +729,22 @@ class StimulationController:
         return self._basic_wss
 
     def _int_to_wss_target(self, value: int | None):
-        target = self._net_types["WssTarget"].Broadcast
-        if value is None:
-            return target
-        if value == 1:
-            return self._net_types["WssTarget"].Wss1
-        if value == 2:
-            return self._net_types["WssTarget"].Wss2
-        if value == 3:
-            return self._net_types["WssTarget"].Wss3
-        return target
+        # Membership test, not a range check: 2.0 selects WSS 2 and anything else
+        # (None, "2", ...) broadcasts, as before the target tuple was cached.
+        if value in (1, 2, 3):
+            return self._target_tuple[int(value)]
+        return self._t_broadcast
 
     @staticmethod
     def _finger_to_channel(finger_or_alias: str) -> int:
         if not finger_or_alias:
             return 0
 
-        if finger_or_alias.lower().startswith("ch"):
+        name = finger_or_alias.lower()
+        if name.startswith("ch"):
             try:
-                return int(finger_or_alias[2:])
+                return int(name[2:])
             except ValueError:
                 return 0
 
-        match = finger_or_alias.lower()
-        if match == "thumb":
-            return 1
-        if match == "index":
-            return 2
-        if match == "middle":
-            return 3
-        if match == "ring":
-            return 4
-        if match in ("pinky", "little"):
-            return 5
-        return 0
+        return _FINGER_CHANNELS.get(name, 0)
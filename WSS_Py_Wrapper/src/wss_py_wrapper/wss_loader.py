@@ -5,9 +5,44 @@ The wrapper loads a set of DLLs using :mod:`pythonnet` and then imports .NET typ
 
 from __future__ import annotations
 
+from functools import lru_cache
+import os
 from pathlib import Path
+import sys
+import threading
 from typing import Iterable
 
+_PRIMARY_DLL = "wss_core_interface.dll"
+
+# pythonnet can host a single runtime per process; remember once it is loaded.
+_RUNTIME_LOADED = False
+_RUNTIME_LOCK = threading.Lock()
+
+# Directories that never hold assemblies to load (reference assemblies, docs).
+_PRUNED_DIRS = frozenset(("ref", "documentation"))
+
+# RID families that name a specific OS. ``runtimes/`` folders of one of these that
+# do not match the current platform are skipped; unknown families are kept.
+_KNOWN_RID_FAMILIES = frozenset(
+    (
+        "android",
+        "browser",
+        "freebsd",
+        "illumos",
+        "ios",
+        "iossimulator",
+        "linux",
+        "maccatalyst",
+        "osx",
+        "solaris",
+        "tvos",
+        "tvossimulator",
+        "unix",
+        "wasi",
+        "win",
+    )
+)
+
 
 class WssLoader:
     """Load .NET DLL references via pythonnet.
@@ -29,6 +64,10 @@ class WssLoader:
 
     @staticmethod
     def _load_runtime() -> None:
+        global _RUNTIME_LOADED
+        if _RUNTIME_LOADED:
+            return
+
         try:
             from pythonnet import load
         except Exception:
@@ -37,41 +76,147 @@ class WssLoader:
         if load is None:
             return
 
-        try:
-            load("netfx")
-        except Exception:
+        with _RUNTIME_LOCK:
+            if _RUNTIME_LOADED:
+                return
             try:
-                load()
+                load("netfx")
+                _RUNTIME_LOADED = True
             except Exception:
-                pass
+                try:
+                    load()
+                    _RUNTIME_LOADED = True
+                except Exception:
+                    pass
 
     @staticmethod
     def _add_references(dll_paths: Iterable[Path]) -> None:
         import clr  # type: ignore
 
+        # Added one at a time, in order: collect_dlls() puts the primary interface
+        # last so its dependencies resolve first.
         for dll in dll_paths:
             clr.AddReference(str(dll))
 
 
-def collect_dlls(cs_lib_dir: Path) -> list[Path]:
+def collect_dlls(cs_lib_dir: Path) -> tuple[Path, ...]:
     """Collect ``.dll`` files from a ``Cs_Libraries`` directory.
 
     DLLs are returned in a stable order; the primary interface DLL
     (``WSS_Core_Interface.dll``) is forced to the end so dependencies are added
-    first.
+    first. ``ref/`` and ``Documentation/`` folders and ``runtimes/<rid>`` folders
+    for other operating systems are skipped. Results are cached per resolved
+    directory; call :func:`invalidate_dll_cache` if the directory contents change
+    at runtime.
 
     :param cs_lib_dir: Directory to search recursively.
-    :returns: List of DLL paths.
+    :returns: Tuple of DLL paths.
     """
+    cs_lib_dir = Path(cs_lib_dir)
     if not cs_lib_dir.exists():
-        return []
+        return ()
+    return _collect_dlls_cached(cs_lib_dir.resolve())
+
+
+def invalidate_dll_cache() -> None:
+    """Forget DLL listings cached by :func:`collect_dlls`."""
+    _collect_dlls_cached.cache_clear()
+
+
+def _runtime_os_names() -> frozenset[str]:
+    """Return the NuGet ``runtimes/<rid>`` OS families usable on this platform."""
+    if sys.platform.startswith("win"):
+        return frozenset(("win",))
+    if sys.platform == "darwin":
+        return frozenset(("osx", "unix"))
+    return frozenset(("linux", "unix"))
 
-    dlls = [p for p in cs_lib_dir.rglob("*.dll") if p.is_file()]
+
+def _rid_family(rid: str) -> str:
+    """Return the OS family of a lower-case NuGet runtime identifier.
+
+    The family is the leading run of letters, so ``win10-x64``, ``win7-x86`` and
+    ``osx.10.14-x64`` map to ``win``/``osx``.
+    """
+    for index, char in enumerate(rid):
+        if not ("a" <= char <= "z"):
+            return rid[:index]
+    return rid
+
+
+@lru_cache(maxsize=16)
+def _collect_dlls_cached(cs_lib_dir: Path) -> tuple[Path, ...]:
+    runtime_os = _runtime_os_names()
+    found: list[str] = []
+    stack = [str(cs_lib_dir)]
+    while stack:
+        current = stack.pop()
+        in_runtimes = os.path.basename(current).lower() == "runtimes"
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    name = entry.name.lower()
+                    if entry.is_dir(follow_symlinks=False):
+                        if name in _PRUNED_DIRS:
+                            continue
+                        if in_runtimes:
+                            family = _rid_family(name)
+                            if family in _KNOWN_RID_FAMILIES and family not in runtime_os:
+                                continue
+                        stack.append(entry.path)
+                    elif name.endswith(".dll") and entry.is_file():
+                        found.append(entry.path)
+        except OSError:
+            continue
+
+    dlls = [Path(p) for p in found]
     dlls.sort(key=lambda p: p.name.lower())
 
     # Ensure the primary interface loads last so dependencies resolve first.
-    primary = [p for p in dlls if p.name.lower() == "wss_core_interface.dll"]
+    primary = [p for p in dlls if p.name.lower() == _PRIMARY_DLL]
     if primary:
         dlls = [p for p in dlls if p not in primary] + primary
 
-    return dlls
+    return tuple(dlls)
+
+
+@lru_cache(maxsize=None)
+def resolve_net_types() -> dict:
+    """Import the .NET types used by the controller.
+
+    Types are imported from ``WSS_Core_Interface`` when available, otherwise from the
+    split ``Wss.*Module`` namespaces. The result is cached for the process lifetime,
+    so call this only after :meth:`WssLoader.load` has added the references; a failed
+    import is not cached.
+
+    :returns: Mapping of type name to the imported .NET type.
+    """
+    try:
+        from WSS_Core_Interface import (  # type: ignore
+            CoreConfigController,
+            ModelConfigController,
+            ModelParamsLayer,
+            StimParamsLayer,
+            WaveformBuilder,
+            WssStimulationCore,
+            WssTarget,
+        )
+    except Exception:
+        from Wss.CoreModule import (  # type: ignore
+            CoreConfigController,
+            WaveformBuilder,
+            WssStimulationCore,
+            WssTarget,
+        )
+        from Wss.ModelModule import ModelConfigController, ModelParamsLayer  # type: ignore
+        from Wss.CalibrationModule import StimParamsLayer  # type: ignore
+
+    return {
+        "CoreConfigController": CoreConfigController,
+        "ModelConfigController": ModelConfigController,
+        "ModelParamsLayer": ModelParamsLayer,
+        "StimParamsLayer": StimParamsLayer,
+        "WaveformBuilder": WaveformBuilder,
+        "WssStimulationCore": WssStimulationCore,
+        "WssTarget": WssTarget,
+    }
@@ -0,0 +1,30 @@
+from wss_py_wrapper.config import WssConfig
+
+
+def test_cs_lib_dir_env_override(tmp_path, monkeypatch):
+    override = tmp_path / "elsewhere" / "libs"
+    monkeypatch.setenv("WSS_CS_LIB_DIR", str(override))
+
+    config = WssConfig.default(tmp_path / "main.py")
+
+    assert config.cs_lib_dir == override
+
+
+def test_cs_lib_dir_searched_upward(tmp_path, monkeypatch):
+    monkeypatch.delenv("WSS_CS_LIB_DIR", raising=False)
+    (tmp_path / "Cs_Libraries").mkdir()
+    start = tmp_path / "app" / "scripts"
+    start.mkdir(parents=True)
+
+    config = WssConfig.default(start / "main.py")
+
+    assert config.cs_lib_dir == tmp_path / "Cs_Libraries"
+
+
+def test_cs_lib_dir_empty_override_is_ignored(tmp_path, monkeypatch):
+    monkeypatch.setenv("WSS_CS_LIB_DIR", "")
+    (tmp_path / "Cs_Libraries").mkdir()
+
+    config = WssConfig.default(tmp_path / "main.py")
+
+    assert config.cs_lib_dir == tmp_path / "Cs_Libraries"
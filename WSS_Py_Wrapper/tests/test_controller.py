@@ -0,0 +1,106 @@
+from types import SimpleNamespace
+import threading
+
+import pytest
+
+from wss_py_wrapper.stimulation_controller import StimulationController
+
+
+@pytest.fixture
+def controller():
+    # Bypass __init__/Initialize: only the cached .NET targets are needed here.
+    ctrl = StimulationController.__new__(StimulationController)
+    ctrl._t_broadcast = "Broadcast"
+    ctrl._target_tuple = ("Broadcast", "Wss1", "Wss2", "Wss3")
+    return ctrl
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (1, "Wss1"),
+        (2, "Wss2"),
+        (3, "Wss3"),
+        (2.0, "Wss2"),
+        (True, "Wss1"),
+        (0, "Broadcast"),
+        (4, "Broadcast"),
+        (-1, "Broadcast"),
+        (None, "Broadcast"),
+        ("2", "Broadcast"),
+    ],
+)
+def test_int_to_wss_target(controller, value, expected):
+    assert controller._int_to_wss_target(value) == expected
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        ("thumb", 1),
+        ("Index", 2),
+        ("MIDDLE", 3),
+        ("ring", 4),
+        ("pinky", 5),
+        ("little", 5),
+        ("ch3", 3),
+        ("CH12", 12),
+        ("ch-1", -1),
+        ("ch 2", 2),
+        ("chx", 0),
+        ("ch", 0),
+        ("wrist", 0),
+        ("", 0),
+        (None, 0),
+    ],
+)
+def test_finger_to_channel(name, expected):
+    assert StimulationController._finger_to_channel(name) == expected
+
+
+class BlockingCore:
+    """Stand-in .NET layer whose Initialize() waits until released."""
+
+    def __init__(self):
+        self.entered = threading.Event()
+        self.release = threading.Event()
+        self.calls = []
+
+    def Tick(self):
+        pass
+
+    def Shutdown(self):
+        self.calls.append("Shutdown")
+
+    def Initialize(self):
+        self.calls.append("Initialize")
+        self.entered.set()
+        self.release.wait(timeout=5)
+
+
+def test_reset_radio_does_not_hold_the_lock_during_initialize():
+    ctrl = StimulationController.__new__(StimulationController)
+    ctrl._config = SimpleNamespace(tick_interval_ms=10)
+    ctrl._gate = threading.Lock()
+    ctrl._initializing = False
+    ctrl._tick_thread = None
+    ctrl._wss = core = BlockingCore()
+
+    reset = threading.Thread(target=ctrl.resetRadio)
+    reset.start()
+    try:
+        assert core.entered.wait(timeout=5)
+        assert ctrl._gate.acquire(timeout=1)
+        ctrl._gate.release()
+        with pytest.raises(RuntimeError):
+            ctrl.Shutdown()
+        with pytest.raises(RuntimeError):
+            ctrl.resetRadio()
+    finally:
+        core.release.set()
+        reset.join(timeout=5)
+
+    assert core.calls == ["Shutdown", "Initialize"]
+    assert not ctrl._initializing
+    assert ctrl._tick_thread is not None and ctrl._tick_thread.is_alive()
+    ctrl._stop_tick_loop()
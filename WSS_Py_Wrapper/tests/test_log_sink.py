@@ -0,0 +1,209 @@
+import gc
+import os
+import threading
+import time
+
+import pytest
+
+from wss_py_wrapper import log_sink
+from wss_py_wrapper.log_sink import BinaryLogSink, FileLogSink, read_binary_log
+
+
+def test_file_sink_appends_formatted_records(tmp_path):
+    sink = FileLogSink(tmp_path / "logs" / "wss.log")
+    sink.write("INFO", "hello %s", "world")
+    sink.write("ERROR", "plain %s text")
+    sink.close()
+
+    lines = sink.path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 2
+    assert lines[0].endswith("] INFO: hello world")
+    assert lines[1].endswith("] ERROR: plain %s text")
+
+
+def test_file_sink_uses_platform_line_endings(tmp_path):
+    sink = FileLogSink(tmp_path / "wss.log")
+    sink.write("INFO", "one")
+    sink.write("INFO", "two")
+    sink.close()
+
+    data = sink.path.read_bytes()
+    assert data.count(os.linesep.encode()) == 2
+    assert data.endswith(b"INFO: two" + os.linesep.encode())
+
+
+def test_file_sink_flush_makes_records_visible(tmp_path):
+    sink = FileLogSink(tmp_path / "wss.log")
+    try:
+        sink.write("INFO", "first")
+        sink.flush()
+        assert sink.path.read_text(encoding="utf-8").endswith("INFO: first\n")
+    finally:
+        sink.close()
+
+
+def test_file_sink_keeps_every_record_from_concurrent_writers(tmp_path):
+    sink = FileLogSink(tmp_path / "wss.log")
+
+    def produce(worker):
+        for i in range(500):
+            sink.write("DEBUG", "worker %d record %d", worker, i)
+
+    threads = [threading.Thread(target=produce, args=(w,)) for w in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    sink.close()
+
+    assert len(sink.path.read_text(encoding="utf-8").splitlines()) == 2000
+
+
+def test_file_sink_reopens_after_close(tmp_path):
+    sink = FileLogSink(tmp_path / "wss.log")
+    sink.write("INFO", "before")
+    sink.close()
+    sink.write("INFO", "after")
+    sink.close()
+
+    lines = sink.path.read_text(encoding="utf-8").splitlines()
+    assert [line.split("] ", 1)[1] for line in lines] == ["INFO: before", "INFO: after"]
+
+
+@pytest.mark.parametrize("round_", range(5))
+def test_file_sink_close_racing_writers_loses_nothing(tmp_path, round_):
+    sink = FileLogSink(tmp_path / "wss.log")
+    # A backlog keeps the writer busy, so the racing records are queued while
+    # close() is still waiting for it.
+    for i in range(5000):
+        sink.write("DEBUG", "backlog %d", i)
+    start = threading.Barrier(4)
+
+    def produce(worker):
+        start.wait()
+        for i in range(300):
+            sink.write("INFO", "worker %d record %d", worker, i)
+
+    threads = [threading.Thread(target=produce, args=(w,)) for w in range(3)]
+    for thread in threads:
+        thread.start()
+    start.wait()
+    sink.close()
+    for thread in threads:
+        thread.join()
+    sink.close()
+
+    assert len(sink.path.read_text(encoding="utf-8").splitlines()) == 5900
+
+
+def test_file_sink_writer_stops_when_sink_is_collected(tmp_path):
+    sink = FileLogSink(tmp_path / "wss.log")
+    sink.write("INFO", "unclosed")
+    writer = sink._writer
+    del sink
+    gc.collect()
+
+    writer.join(timeout=2)
+    assert not writer.is_alive()
+    assert (tmp_path / "wss.log").read_text(encoding="utf-8").endswith("INFO: unclosed\n")
+
+
+def test_file_sink_open_failure_reaches_caller(tmp_path):
+    sink = FileLogSink(tmp_path)  # a directory cannot be opened for appending
+    with pytest.raises(OSError):
+        sink.write("INFO", "lost")
+    sink.flush()
+    sink.close()
+
+
+def test_file_sink_replaces_dead_writer(tmp_path):
+    sink = FileLogSink(tmp_path / "wss.log")
+    dead = threading.Thread(target=lambda: None)
+    dead.start()
+    dead.join()
+    sink._writer = dead
+
+    started = time.monotonic()
+    sink.flush()
+    assert time.monotonic() - started < 1
+
+    sink.write("INFO", "recovered")
+    assert sink._writer is not dead
+    sink.close()
+    assert sink.path.read_text(encoding="utf-8").endswith("INFO: recovered\n")
+
+
+def test_file_sink_reports_write_errors(tmp_path, monkeypatch, capsys):
+    def fail(fd, data):
+        raise OSError("disk full")
+
+    sink = FileLogSink(tmp_path / "wss.log")
+    monkeypatch.setattr(log_sink.os, "write", fail)
+    sink.write("INFO", "lost")
+    sink.close()
+
+    assert "dropped 1 record(s)" in capsys.readouterr().err
+
+
+def test_file_sink_level_gate(tmp_path):
+    sink = FileLogSink(tmp_path / "wss.log", min_level="warn")
+    assert not sink.is_enabled("INFO")
+    assert sink.is_enabled("ERROR")
+    assert sink.is_enabled("CUSTOM")
+    with pytest.raises(ValueError):
+        sink.set_level("LOUD")
+
+
+def test_binary_sink_round_trip(tmp_path):
+    sink = BinaryLogSink(tmp_path / "wss.blog")
+    started = sink.register_message("started")
+    amplitude = sink.register_message("amplitude %d uA")
+    sink.record("INFO", started)
+    sink.write("WARN", "amplitude %d uA", 1500)
+    sink.record("ERROR", amplitude, 0xFFFFFFFF)
+    sink.close()
+
+    records = list(read_binary_log(sink.path))
+    assert [(level, text) for _, level, text in records] == [
+        ("INFO", "started"),
+        ("WARN", "amplitude 1500 uA"),
+        ("ERROR", f"amplitude {0xFFFFFFFF} uA"),
+    ]
+    assert records[0][0] <= records[1][0] <= records[2][0]
+
+
+def test_binary_sink_appends_after_close(tmp_path):
+    sink = BinaryLogSink(tmp_path / "wss.blog")
+    msg = sink.register_message("tick %d")
+    sink.record("INFO", msg, 1)
+    sink.close()
+    sink.record("INFO", msg, 2)
+    sink.close()
+
+    assert [text for _, _, text in read_binary_log(sink.path)] == ["tick 1", "tick 2"]
+    with pytest.raises(RuntimeError):
+        sink.register_message("late")
+
+
+def test_binary_sink_write_drops_unencodable_records(tmp_path):
+    sink = BinaryLogSink(tmp_path / "wss.blog", min_level="INFO")
+    sink.register_message("value %d")
+    sink.write("INFO", "never registered")
+    sink.write("INFO", "value %d", -1)
+    sink.write("INFO", "value %d", "text")
+    sink.write("DEBUG", "never registered")
+    sink.write("INFO", "value %d", 7)
+    sink.close()
+
+    assert sink.dropped == 3
+    assert [text for _, _, text in read_binary_log(sink.path)] == ["value 7"]
+
+
+@pytest.mark.parametrize("msg_id, arg", [(5, 0), (0, -1), (0, 1 << 32), (0, 1.5)])
+def test_binary_sink_record_rejects_invalid_values(tmp_path, msg_id, arg):
+    sink = BinaryLogSink(tmp_path / "wss.blog")
+    sink.register_message("value %d")
+    with pytest.raises(ValueError):
+        sink.record("INFO", msg_id, arg)
+    sink.close()
+    assert not sink.path.exists()
@@ -0,0 +1,53 @@
+import pytest
+
+from wss_py_wrapper.log_sink import LogSink
+from wss_py_wrapper.logger import Logger
+
+
+class RecordingSink(LogSink):
+    def __init__(self):
+        self.records = []
+
+    def write(self, level, message, *args):
+        self.records.append((level, message, args))
+
+
+class Unformattable:
+    def __str__(self):
+        raise AssertionError("disabled records must not be formatted")
+
+    __repr__ = __str__
+
+
+def test_logger_passes_format_arguments_unformatted():
+    sink = RecordingSink()
+    logger = Logger(sink)
+    logger.debug("d %s", 1)
+    logger.info("plain")
+    logger.warning("w %d %d", 2, 3)
+    logger.error("e")
+
+    assert sink.records == [
+        ("DEBUG", "d %s", (1,)),
+        ("INFO", "plain", ()),
+        ("WARN", "w %d %d", (2, 3)),
+        ("ERROR", "e", ()),
+    ]
+
+
+def test_logger_skips_levels_below_sink_minimum():
+    sink = RecordingSink()
+    sink.set_level("WARN")
+    logger = Logger(sink)
+    logger.debug("d %s", Unformattable())
+    logger.info("i %s", Unformattable())
+    logger.warning("kept")
+
+    assert sink.records == [("WARN", "kept", ())]
+    assert not logger.is_enabled_for("info")
+    assert logger.is_enabled_for("error")
+
+
+def test_sink_rejects_unknown_level():
+    with pytest.raises(ValueError):
+        RecordingSink().set_level("verbose")
@@ -0,0 +1,40 @@
+import pytest
+
+from wss_py_wrapper import wss_loader
+
+
+def _touch(path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"")
+
+
+@pytest.fixture
+def windows_host(monkeypatch):
+    monkeypatch.setattr(wss_loader, "_runtime_os_names", lambda: frozenset(("win",)))
+    wss_loader.invalidate_dll_cache()
+    yield
+    wss_loader.invalidate_dll_cache()
+
+
+def test_collect_dlls_orders_primary_last_and_prunes(tmp_path, windows_host):
+    _touch(tmp_path / "WSS_Core_Interface.dll")
+    _touch(tmp_path / "b.dll")
+    _touch(tmp_path / "lib" / "a.dll")
+    _touch(tmp_path / "ref" / "skipped.dll")
+    _touch(tmp_path / "Documentation" / "skipped.dll")
+    _touch(tmp_path / "notes.txt")
+
+    names = [p.name for p in wss_loader.collect_dlls(tmp_path)]
+    assert names == ["a.dll", "b.dll", "WSS_Core_Interface.dll"]
+
+
+def test_collect_dlls_matches_rid_by_os_family(tmp_path, windows_host):
+    for rid in ("win", "win-x64", "win7-x64", "win10-arm64", "osx.10.14-x64", "linux-musl-x64", "unix", "alpine.3.9-x64"):
+        _touch(tmp_path / "runtimes" / rid / "lib" / f"{rid}.dll")
+
+    names = {p.name for p in wss_loader.collect_dlls(tmp_path)}
+    assert names == {"win.dll", "win-x64.dll", "win7-x64.dll", "win10-arm64.dll", "alpine.3.9-x64.dll"}
+
+
+def test_collect_dlls_missing_directory(tmp_path):
+    assert wss_loader.collect_dlls(tmp_path / "missing") == ()